@@ -1,18 +1,35 @@
-import time
+import sys
+import uasyncio as asyncio
 from machine import Pin, I2C
+from micropython import const
 from micropython_bmpxxx import bmpxxx
 
 #i2c = I2C(1, sda=Pin(2), scl=Pin(3))  # Correct I2C pins for RP2040
 i2c = I2C(id=1, scl=Pin(27), sda=Pin(26))
 
-i2c1_devices = i2c.scan()
-if i2c1_devices:
-    for d in i2c1_devices: print(f"i2c1 device at address: {hex(d)}")
+# exact meters to feet/inches ratio as integers: 1 inch = 25.4 mm, 1 foot = 12 inches
+_TENTH_IN_PER_MM_NUM = const(100)
+_TENTH_IN_PER_MM_DEN = const(254)
+_TENTH_IN_PER_FOOT = const(120)
+
+BMP_ADDRESS = 0x76
+DEBUG = False  # True lists every device on the bus (scan probes all 127 addresses)
+
+if DEBUG:
+    i2c1_devices = i2c.scan()
+    if i2c1_devices:
+        for d in i2c1_devices: print(f"i2c1 device at address: {hex(d)}")
+    else:
+        print("ERROR: No i2c1 devices")
 else:
-    print("ERROR: No i2c1 devices")
+    # only probe the address we expect
+    try:
+        i2c.writeto(BMP_ADDRESS, b"")
+    except OSError:
+        print(f"ERROR: No i2c1 device at address: {hex(BMP_ADDRESS)}")
 print("")
     
-bmp = bmpxxx.BMP390(i2c=i2c, address=0x76)
+bmp = bmpxxx.BMP390(i2c=i2c, address=BMP_ADDRESS)
 
 sea_level_pressure = bmp.sea_level_pressure
 print(f"initial sea_level_pressure = {sea_level_pressure:.2f} hPa")
@@ -28,17 +45,40 @@ print(f"Adjusted sea level pressure = {bmp.sea_level_pressure:.2f} hPa")
 bmp.altitude = 111.0
 print(f"Adjusted SLP using {bmp.altitude:.2f} meter altitude = {bmp.sea_level_pressure:.2f} hPa\n")
 
-while True:
-    print(f"Pressure = {bmp.pressure:.2f} hPa")
-    temp = bmp.temperature
-    print(f"temp = {temp:.2f} C")
-  
-    meters = bmp.altitude
-    print(f"Altitude = {meters:.2f} meters")
-    feet = meters * 3.28084
-    feet_only = int(feet)
-    inches = (feet - feet_only) * 12
-    print(f"Altitude = {feet_only} feet {inches:.1f} inches")
-
-    time.sleep(2.5)
- 
\ No newline at end of file
+
+def fmt2(x):
+    # 2 decimal places using only integer formatting, avoids float-to-string conversion
+    n = int(x * 100 + (0.5 if x >= 0 else -0.5))
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    return f"{sign}{n // 100}.{n % 100:02d}"
+
+
+async def read_loop(bmp):
+    # bind the driver methods once, saves an attribute lookup per call in the loop
+    read_pt, altitude_from = bmp.read_pt, bmp.altitude_from
+    while True:
+        # one I2C burst for pressure & temperature, altitude derived without another read
+        pressure, temp = read_pt()
+        meters = altitude_from(pressure)
+
+        # feet & inches with integer math, on the magnitude since // and divmod floor negative values
+        mm = int(meters * 1000)
+        sign = "-" if mm < 0 else ""
+        tenth_in = (abs(mm) * _TENTH_IN_PER_MM_NUM) // _TENTH_IN_PER_MM_DEN
+        feet_only, tenth_in = divmod(tenth_in, _TENTH_IN_PER_FOOT)
+
+        # one write to stdout per reading instead of one per line
+        sys.stdout.write(
+            f"Pressure = {fmt2(pressure)} hPa\n"
+            f"temp = {fmt2(temp)} C\n"
+            f"Altitude = {fmt2(meters)} meters\n"
+            f"Altitude = {sign}{feet_only} feet {tenth_in // 10}.{tenth_in % 10} inches\n"
+        )
+
+        # yield to other coroutines (display, Wi-Fi, buttons) until the next reading,
+        # in NORMAL mode the sensor has converted again well before this sleep ends
+        await asyncio.sleep_ms(2500)
+
+
+asyncio.run(read_loop(bmp))
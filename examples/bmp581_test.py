@@ -1,27 +1,42 @@
-import time
+import uasyncio as asyncio
 from machine import Pin, I2C
+from micropython import const
 from micropython_bmpxxx import bmpxxx
 
 #i2c = I2C(1, sda=Pin(2), scl=Pin(3))  # Correct I2C pins for RP2040
 i2c = I2C(id=1, scl=Pin(27), sda=Pin(26), freq=400_000)
 
-i2c1_devices = i2c.scan()
-if i2c1_devices:
-    for d in i2c1_devices: print(f"i2c1 device at address: {hex(d)}")
+# exact meters to feet/inches ratio as integers: 1 inch = 25.4 mm, 1 foot = 12 inches
+_TENTH_IN_PER_MM_NUM = const(100)
+_TENTH_IN_PER_MM_DEN = const(254)
+_TENTH_IN_PER_FOOT = const(120)
+
+BMP_ADDRESS = 0x76
+DEBUG = False  # True lists every device on the bus (scan probes all 127 addresses)
+
+if DEBUG:
+    i2c1_devices = i2c.scan()
+    if i2c1_devices:
+        for d in i2c1_devices: print(f"i2c1 device at address: {hex(d)}")
+    else:
+        print("ERROR: No i2c1 devices")
 else:
-    print("ERROR: No i2c1 devices")
+    # only probe the address we expect
+    try:
+        i2c.writeto(BMP_ADDRESS, b"")
+    except OSError:
+        print(f"ERROR: No i2c1 device at address: {hex(BMP_ADDRESS)}")
 print("")
     
 #bmp = bmp58x.BMP585(i2c=i2c, address=0x47)
-bmp = bmpxxx.BMP390(i2c=i2c, address=0x76)
+bmp = bmpxxx.BMP390(i2c=i2c, address=BMP_ADDRESS)
 
 
 print(f"Sensor pressure = {bmp.pressure:.2f} hPa")
 print(f"Sensor pressure = {bmp.pressure:.2f} hPa")
 
 # Set for the Highest resolution for bmp585 & bmp581
-bmp.pressure_oversample_rate = bmp.OSR128
-bmp.temperature_oversample_rate = bmp.OSR8
+bmp.configure(osr_p=bmp.OSR128, osr_t=bmp.OSR8)
 print(f"Oversample rate setting:")
 print(f"{bmp.pressure_oversample_rate=}")
 print(f"{bmp.temperature_oversample_rate=}\n")
@@ -38,15 +53,15 @@ bmp.altitude = 111.0
 print(f"Altitude 111m = {bmp.altitude:.2f} meters")
 print(f"Adjusted SLP based on known altitude = {bmp.sea_level_pressure:.2f} hPa\n")
 
-bmp.config
+if DEBUG:
+    bmp.config  # prints driver settings and a sample
 
 # # bmp585 & bmp581, IIR only configurable during in STANDBY mode.
 # print(f"Current IIR setting: {bmp.iir_coefficient=}")
 # bmp.iir_coefficient = bmp.COEF_3
 # print(f"update to bmp.COEF_3: {bmp.iir_coefficient=}\n")
-# for iir_coef in bmp.iir_coefficient_values:
-#     bmp.iir_coefficient = iir_coef
-#     print(f"New IIR setting: {bmp.iir_coefficient}")
+# # sweep all settings with a single STANDBY switch and a single power mode restore
+# bmp.sweep_iir(bmp.iir_coefficient_values, lambda v: print(f"New IIR setting: {v}"))
 # 
 # print("Current power mode setting: ", bmp.power_mode)
 # for power_mode in bmp.power_mode_values:
@@ -54,26 +69,47 @@ bmp.config
 #     print(f"New Power mode setting: {bmp.power_mode}")
 
 bmp.iir_coefficient = bmp.COEF_0
-while True:
-    # altitude in meters based on sea level pressure stored in driver
-    sea_level_pressure = bmp.sea_level_pressure
-#     print(f"Sea level pressure = {sea_level_pressure:.2f} hPa")
-    
-    # Pressure in hPA measured at sensor, temperature in Celsius
-    pressure = bmp.pressure
-#     print(f"Sensor pressure = {pressure:.2f} hPa")
-    temp = bmp.temperature
-#     print(f"temp = {temp:.2f} C")
-  
-    # Pressure in hPA measured at sensor
-    meters = bmp.altitude
-    print(f"Altitude = {meters:.3f} meters")
-    feet = meters * 3.28084
-    feet_only = int(feet)
-    inches = (feet - feet_only) * 12
-#     print(f"Altitude = {feet_only} feet {inches:.1f} inches\n")
-
-    time.sleep(2.5)
+
+
+def fmt3(x):
+    # 3 decimal places using only integer formatting, avoids float-to-string conversion
+    n = int(x * 1000 + (0.5 if x >= 0 else -0.5))
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    return f"{sign}{n // 1000}.{n % 1000:03d}"
+
+
+async def read_loop(bmp):
+    # sea level pressure does not change inside the loop, read it once
+    slp_cached = bmp.sea_level_pressure
+    # bind the driver methods once, saves an attribute lookup per call in the loop
+    read_pt, altitude_from = bmp.read_pt, bmp.altitude_from
+    while True:
+        # altitude in meters based on sea level pressure stored in driver
+        sea_level_pressure = slp_cached
+#         print(f"Sea level pressure = {sea_level_pressure:.2f} hPa")
+
+        # Pressure in hPA measured at sensor, temperature in Celsius, from one I2C burst
+        pressure, temp = read_pt()
+#         print(f"Sensor pressure = {pressure:.2f} hPa")
+#         print(f"temp = {temp:.2f} C")
+
+        # Altitude from the pressure just read, no additional I2C read
+        meters = altitude_from(pressure)
+        print(f"Altitude = {fmt3(meters)} meters")
+        # feet & inches with integer math, on the magnitude since // and divmod floor negative values
+        mm = int(meters * 1000)
+        sign = "-" if mm < 0 else ""
+        tenth_in = (abs(mm) * _TENTH_IN_PER_MM_NUM) // _TENTH_IN_PER_MM_DEN
+        feet_only, tenth_in = divmod(tenth_in, _TENTH_IN_PER_FOOT)
+#         print(f"Altitude = {sign}{feet_only} feet {tenth_in // 10}.{tenth_in % 10} inches\n")
+
+        # yield to other coroutines (display, Wi-Fi, buttons) until the next reading,
+        # in NORMAL mode the sensor has converted again well before this sleep ends
+        await asyncio.sleep_ms(2500)
+
+
+asyncio.run(read_loop(bmp))
 
 # while True:
 #     for iir_coefficient in bmp.iir_coefficient_values:
@@ -15,9 +15,7 @@ print("")
 bmp = bmpxxx.BMP585(i2c=i2c, address=0x47)
 
 # Set for the Highest resolution for bmp585 & bmp581
-bmp.pressure_oversample_rate = bmp.OSR128
-bmp.temperature_oversample_rate = bmp.OSR8
-bmp.iir_coefficient = bmp.COEF_3
+bmp.configure(osr_p=bmp.OSR128, osr_t=bmp.OSR8, iir=bmp.COEF_3)
 print(f"Oversample rate setting:")
 print(f"{bmp.pressure_oversample_rate=}")
 print(f"{bmp.temperature_oversample_rate=}\n")
@@ -41,9 +39,8 @@ bmp.config
 # print(f"Current IIR setting: {bmp.iir_coefficient=}")
 # bmp.iir_coefficient = bmp.COEF_3
 # print(f"update to bmp.COEF_3: {bmp.iir_coefficient=}\n")
-# for iir_coef in bmp.iir_coefficient_values:
-#     bmp.iir_coefficient = iir_coef
-#     print(f"New IIR setting: {bmp.iir_coefficient}")
+# # sweep all settings with a single STANDBY switch and a single power mode restore
+# bmp.sweep_iir(bmp.iir_coefficient_values, lambda v: print(f"New IIR setting: {v}"))
 # 
 # print("Current power mode setting: ", bmp.power_mode)
 # for power_mode in bmp.power_mode_values:
@@ -38,6 +38,7 @@ Based on
 """
 import time
 
+import micropython
 from micropython import const
 from micropython_bmpxxx.i2c_helpers import CBits, RegisterStruct
 
@@ -51,6 +52,29 @@ __repo__ = "https://github.com/bradcar/MicroPython_BMP58x.git"
 
 WORLD_AVERAGE_SEA_LEVEL_PRESSURE = 1013.25  # International average standard
 
+_S24 = const(0x800000)  # sign bit of a 24-bit register value
+
+# BMP280 osrs register value for OSR1, OSR2, OSR4, OSR8, OSR16 & OSR_SKIP (0x00..0x05)
+_BMP280_OSR = (1, 2, 3, 4, 5, 0)
+
+
+@micropython.viper
+def _s24(val: int) -> int:
+    """Sign-extend a 24-bit two's complement value without branching"""
+    return (val ^ _S24) - _S24
+
+
+@micropython.viper
+def _u24(buf: ptr8, offset: int) -> int:
+    """Unsigned little-endian 24-bit value at buf[offset], decoded with native byte loads"""
+    return buf[offset] | (buf[offset + 1] << 8) | (buf[offset + 2] << 16)
+
+
+@micropython.viper
+def _ewma(prev: int, new: int, shift: int) -> int:
+    """Exponential moving average step in fixed point, new sample weighted 1/2**shift"""
+    return prev + ((new - prev) >> shift)
+
 
 class BMP581:
     """Driver for the BMP585 Sensor connected over I2C.
@@ -108,6 +132,9 @@ class BMP581:
     FORCED = const(0x02)
     NON_STOP = const(0x03)
     power_mode_values = (STANDBY, NORMAL, FORCED, NON_STOP)
+    # setting values are contiguous from 0, so setters check 0 <= value <= _MAX_* derived from the tuples
+    _MAX_POWER_MODE = len(power_mode_values) - 1
+    _POWER_NAMES = ("STANDBY", "NORMAL", "FORCED", "NON_STOP")
 
     # Oversample Rate
     OSR1 = const(0x00)
@@ -122,6 +149,8 @@ class BMP581:
     # oversampling rates
     pressure_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16, OSR32, OSR64, OSR128)
     temperature_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16, OSR32, OSR64, OSR128)
+    _MAX_OSR = len(pressure_oversample_rate_values) - 1
+    _OSR_NAMES = ("OSR1", "OSR2", "OSR4", "OSR8", "OSR16", "OSR32", "OSR64", "OSR128")
 
     # IIR Filters Coefficients
     COEF_0 = const(0x00)
@@ -133,97 +162,142 @@ class BMP581:
     COEF_63 = const(0x06)
     COEF_127 = const(0x07)
     iir_coefficient_values = (COEF_0, COEF_1, COEF_3, COEF_7, COEF_15, COEF_31, COEF_63, COEF_127)
+    _MAX_IIR = len(iir_coefficient_values) - 1
+    _COEF_NAMES = ("COEF_0", "COEF_1", "COEF_3", "COEF_7", "COEF_15", "COEF_31", "COEF_63", "COEF_127")
 
     BMP581_I2C_ADDRESS_DEFAULT = 0x47
     BMP581_I2C_ADDRESS_SECONDARY = 0x46
 
+    # per sensor values used by _bringup()
+    _name = "BMP581"
+    _expected_id = 0x50
+    _primary_addr = BMP581_I2C_ADDRESS_DEFAULT
+    _secondary_addr = BMP581_I2C_ADDRESS_SECONDARY
+    _default_odr = 0  # None keeps the power-on output data rate
+
     # bmp581 Address & Settings
     _REG_WHOAMI = const(0x01)
+    _INT_SOURCE = const(0x15)
     _INT_STATUS = const(0x27)
     _DSP_CONFIG = const(0x30)
     _DSP_IIR = const(0x31)
     _OSR_CONF = const(0x36)
     _ODR_CONFIG = const(0x37)
+    _TEMP_DATA = const(0x1D)
+    _PRESS_DATA = const(0x20)
     _CMD_BMP581 = const(0x7e)
 
     _device_id = RegisterStruct(_REG_WHOAMI, "B")
     _SOFTRESET = const(0xB6)  # same value for 585,581,390,280
 
-    _cmd_register_BMP581 = CBits(8, _CMD_BMP581, 0)
-    _drdy_status = CBits(1, _INT_STATUS, 0)
+    _cmd_register = CBits(8, _CMD_BMP581, 0)  # 0x7e on BMP581/585/390, BMP280 overrides
+    _drdy_enabled = CBits(1, _INT_SOURCE, 0)
+    _drdy_status = CBits(1, _INT_STATUS, 0)  # cleared when read
     _power_mode = CBits(2, _ODR_CONFIG, 0)
     _temperature_oversample_rate = CBits(3, _OSR_CONF, 0)
     _pressure_oversample_rate = CBits(3, _OSR_CONF, 3)
     _output_data_rate = CBits(5, _ODR_CONFIG, 2)
     _pressure_enabled = CBits(1, _OSR_CONF, 6)
     _iir_coefficient = CBits(3, _DSP_IIR, 3)  # Pressure IIR coefficient
-    _iir_temp_coefficient = CBits(3, _DSP_IIR, 0)  # Temp IIR coefficient
-    _iir_control = CBits(8, _DSP_CONFIG, 0)
-    _temperature = CBits(24, 0x1D, 0, 3)
-    _pressure = CBits(24, 0x20, 0, 3)
+    _iir_both = CBits(6, _DSP_IIR, 0)  # Pressure & temp IIR coefficients in one write
 
-    def __init__(self, i2c, address: int = None) -> None:
-        time.sleep_ms(3)  # t_powup done in 2ms
+    _filtered = None  # software filter state for filtered_pressure()
 
-        # If no address is provided, try the default, then secondary
-        if address is None:
-            if self._check_address(i2c, self.BMP581_I2C_ADDRESS_DEFAULT):
-                address = self.BMP581_I2C_ADDRESS_DEFAULT
-            elif self._check_address(i2c, self.BMP581_I2C_ADDRESS_SECONDARY):
-                address = self.BMP581_I2C_ADDRESS_SECONDARY
-            else:
-                raise RuntimeError("BMP581 sensor not found at I2C expected address (0x47,0x46).")
-        else:
-            # Check if the specified address is valid
-            if not self._check_address(i2c, address):
-                raise RuntimeError("BMP581 sensor not found at I2C expected address (0x47,0x46).")
+    # read_pt() reuses its last sample for this many ms, 0 disables the cache
+    cache_ttl_ms = 0
+    _cached = None
+    _cached_ms = 0
 
-        self._i2c = i2c
-        self._address = address
-        if self._read_device_id() != 0x50:  # check _device_id after i2c established
-            raise RuntimeError("Failed to find the BMP581 sensor")
+    def __init__(self, i2c, address: int = None) -> None:
+        self._bringup(i2c, address)
 
-        self._cmd_register_BMP581 = _SOFTRESET
+        self._cmd_register = _SOFTRESET
         time.sleep_ms(5)  # soft reset finishes in 2ms
 
-        # Must be in STANDBY to initialize _iir_coefficient    
-        self._power_mode = STANDBY
-        time.sleep_ms(5)  # mode change takes 4ms
+        # Must be in STANDBY to initialize _iir_coefficient, soft reset normally leaves it there
+        if self._power_mode != STANDBY:
+            self._power_mode = STANDBY
+            time.sleep_ms(5)  # mode change takes 4ms
         self._pressure_enabled = True
-        self._output_data_rate = 0  # Default rate
+        self._drdy_enabled = True  # data-ready flag in _INT_STATUS, used by wait_drdy()
+        if self._default_odr is not None:
+            self._output_data_rate = self._default_odr
         self._temperature_oversample_rate = self.OSR1  # Default oversampling
         self._pressure_oversample_rate = self.OSR1  # Default oversampling
-        self._iir_coefficient = COEF_0
-        self._iir_temp_coefficient = COEF_0
+        self._iir_both = (COEF_0 << 3) | COEF_0
         self._power_mode = NORMAL
-        time.sleep_ms(5)  # mode change takes 4ms
+        self.wait_drdy(10)  # first OSR1 conversion, bounded instead of a fixed sleep
 
-#         self._drdy_status = 0  # Default data-ready status
         self.sea_level_pressure = WORLD_AVERAGE_SEA_LEVEL_PRESSURE
 
-    def _check_address(self, i2c, address: int) -> bool:
-        """Helper function to check if a device responds at the given I2C address."""
-        try:
-            i2c.writeto(address, b"")  # Attempt a write operation
-            return True
-        except OSError:
-            return False
+    def _bringup(self, i2c, address: int = None) -> None:
+        """
+        Bring-up shared by all sensors: wait for power up, find the address and check the
+        device id against the class values _name, _expected_id, _primary_addr & _secondary_addr
+        """
+        time.sleep_ms(3)  # t_powup done in 2ms
+
+        # If no address is provided, try the default, then secondary
+        found = self._pick_address(i2c, self._primary_addr, self._secondary_addr, address)
+        if found is None:
+            if address is None:
+                raise RuntimeError(f"{self._name} sensor not found at I2C expected address "
+                                   f"(0x{self._primary_addr:02x},0x{self._secondary_addr:02x}).")
+            raise RuntimeError(f"{self._name} sensor not found at specified I2C address (0x{address:02x}).")
+
+        self._i2c = i2c
+        self._address = found
+        self._readmem = i2c.readfrom_mem_into  # bound once, the sample reads skip two lookups
+        self._rx = bytearray(6)  # reused by read_raw_pt(), no allocation per sample
+        self._rx3 = memoryview(self._rx)[:3]  # reused by _read_u24()
+        if self._read_device_id() != self._expected_id:  # check _device_id after i2c established
+            raise RuntimeError(f"Failed to find the {self._name} sensor with id 0x{self._expected_id:02x}")
+
+    @staticmethod
+    def _pick_address(i2c, primary: int, secondary: int, address: int = None) -> int:
+        """
+        Helper function to find the sensor address: the specified address if given,
+        otherwise the primary then secondary address. Only those addresses are probed.
+        :return: first address that responds, None if none does
+        """
+        for candidate in (primary, secondary) if address is None else (address,):
+            try:
+                i2c.writeto(candidate, b"")  # Attempt a write operation
+                return candidate
+            except OSError:
+                pass
+        return None
 
     def _read_device_id(self) -> int:
         return self._device_id
 
+    def _read_u24(self, register: int) -> int:
+        """
+        Read one little-endian 24-bit data register into the preallocated buffer
+        :return: raw unsigned value
+        """
+        data = self._rx3
+        self._readmem(self._address, register, data)
+        return _u24(data, 0)
+
     @property
     def config(self):
-        print(f"{hex(self._address)=}")
-        print(f"{hex(self._device_id)=}")
-        print(f"{self.power_mode=}")
-        print(f"{self.pressure_oversample_rate=}")
-        print(f"{self.temperature_oversample_rate=}")
-        print(f"{self.iir_coefficient=}")
-        print(f"{self.sea_level_pressure=}")
-        print(f"{self.pressure=} hPa")
-        print(f"{self.temperature=} C")
-        print(f"{self.altitude=} m\n")
+        """
+        Print the driver settings and a sample, the settings registers are read in one burst
+        and the sample with read_all(), two I2C transactions in total
+        """
+        mode, osr_p, osr_t, iir = self._read_settings()
+        tempc, pressure, meters = self.read_all()
+        print(f"address={hex(self._address)}\n"
+              f"device_id={hex(self._expected_id)}\n"
+              f"power_mode={self._POWER_NAMES[mode]!r}\n"
+              f"pressure_oversample_rate={self._OSR_NAMES[osr_p]!r}\n"
+              f"temperature_oversample_rate={self._OSR_NAMES[osr_t]!r}\n"
+              f"iir_coefficient={self._COEF_NAMES[iir]!r}\n"
+              f"sea_level_pressure={self._sea_level_pressure}\n"
+              f"pressure={pressure} hPa\n"
+              f"temperature={tempc} C\n"
+              f"altitude={meters} m\n")
 
     @property
     def power_mode(self) -> str:
@@ -238,12 +312,11 @@ class BMP581:
         | :py:const:`bmp58x.NON_STOP` | :py:const:`0X03` |
         +-----------------------------+------------------+
         """
-        values = ("STANDBY", "NORMAL", "FORCED", "NON_STOP",)
-        return values[self._power_mode]
+        return self._POWER_NAMES[self._power_mode]
 
     @power_mode.setter
     def power_mode(self, value: int) -> None:
-        if value not in self.power_mode_values:
+        if not 0 <= value <= self._MAX_POWER_MODE:
             raise ValueError("Value must be a valid power_mode setting: STANDBY,NORMAL,FORCED,NON_STOP")
         self._power_mode = value
 
@@ -268,12 +341,11 @@ class BMP581:
         +---------------------------+------------------+
         :return: sampling rate as string
         """
-        string_name = ("OSR1", "OSR2", "OSR4", "OSR8", "OSR16", "OSR32", "OSR64", "OSR128",)
-        return string_name[self._pressure_oversample_rate]
+        return self._OSR_NAMES[self._pressure_oversample_rate]
 
     @pressure_oversample_rate.setter
     def pressure_oversample_rate(self, value: int) -> None:
-        if value not in self.pressure_oversample_rate_values:
+        if not 0 <= value <= self._MAX_OSR:
             raise ValueError(
                 "Value must be a valid pressure_oversample_rate: OSR1,OSR2,OSR4,OSR8,OSR16,OSR32,OSR64,OSR128")
         self._pressure_oversample_rate = value
@@ -296,12 +368,11 @@ class BMP581:
         +---------------------------+------------------+
         :return: sampling rate as string
         """
-        string_name = ("OSR1", "OSR2", "OSR4", "OSR8", "OSR16", "OSR32", "OSR64", "OSR128",)
-        return string_name[self._temperature_oversample_rate]
+        return self._OSR_NAMES[self._temperature_oversample_rate]
 
     @temperature_oversample_rate.setter
     def temperature_oversample_rate(self, value: int) -> None:
-        if value not in self.temperature_oversample_rate_values:
+        if not 0 <= value <= self._MAX_OSR:
             raise ValueError(
                 "Value must be a valid temperature_oversample_rate: OSR1,OSR2,OSR4,OSR8,OSR16,OSR32,OSR64,OSR128")
         self._temperature_oversample_rate = value
@@ -311,16 +382,105 @@ class BMP581:
         """
         :return: Temperature in Celsius
         """
-        raw_temp = self._temperature
-        return self._twos_comp(raw_temp, 24) / 65536.0
+        if self.cache_ttl_ms:
+            return self.read_pt()[1]
+        raw_temp = self._read_u24(_TEMP_DATA)
+        return _s24(raw_temp) / 65536.0
 
     @property
     def pressure(self) -> float:
         """
         :return: Pressure in hPa
         """
-        raw_pressure = self._pressure
-        return self._twos_comp(raw_pressure, 24) / 64.0 / 100.0
+        if self.cache_ttl_ms:
+            return self.read_pt()[0]
+        raw_pressure = self._read_u24(_PRESS_DATA)
+        return _s24(raw_pressure) / 6400.0  # Pa/64 -> hPa in one division
+
+    def read_raw_pt(self) -> tuple:
+        """
+        Read the raw pressure and temperature from a single I2C burst of the data registers
+        :return: (raw pressure, raw temperature)
+        """
+        data = self._rx
+        self._readmem(self._address, _TEMP_DATA, data)
+        raw_temp = _u24(data, 0)
+        raw_pressure = _u24(data, 3)
+        return raw_pressure, raw_temp
+
+    def compensate_t(self, raw_temp: int) -> float:
+        """
+        :return: Temperature in Celsius from a raw temperature reading
+        """
+        return _s24(raw_temp) / 65536.0
+
+    def compensate_p(self, raw_pressure: int, tempc: float) -> float:
+        """
+        tempc is not needed by BMP585/BMP581, it is kept so every sensor has the same call
+        :return: Pressure in hPa from a raw pressure reading
+        """
+        return _s24(raw_pressure) / 6400.0  # Pa/64 -> hPa in one division
+
+    def read_pt(self) -> tuple:
+        """
+        Read pressure and temperature from a single I2C burst of the data registers
+        When cache_ttl_ms is set, a sample younger than cache_ttl_ms is returned without an I2C read
+        :return: (pressure in hPa, temperature in Celsius)
+        """
+        ttl = self.cache_ttl_ms
+        if ttl:
+            now = time.ticks_ms()
+            if self._cached is not None and time.ticks_diff(now, self._cached_ms) < ttl:
+                return self._cached
+        raw_pressure, raw_temp = self.read_raw_pt()
+        tempc = self.compensate_t(raw_temp)
+        sample = self.compensate_p(raw_pressure, tempc), tempc
+        if ttl:
+            self._cached = sample
+            self._cached_ms = now
+        return sample
+
+    def read_all(self) -> tuple:
+        """
+        Temperature, pressure & altitude from a single I2C burst of the data registers,
+        reading temperature, pressure and then altitude costs three transactions
+        :return: (temperature in Celsius, pressure in hPa, altitude in meters)
+        """
+        pressure, tempc = self.read_pt()
+        return tempc, pressure, self.altitude_from(pressure)
+
+    def filtered_pressure(self, shift: int = 3) -> float:
+        """
+        Read pressure and smooth it in software with an exponential moving average,
+        each new sample is weighted 1/2**shift. Unlike iir_coefficient this needs no
+        sensor reconfiguration, the first call starts the average at the current pressure.
+        :return: Filtered pressure in hPa
+        """
+        sample = int(self.read_pt()[0] * 1600.0)  # 1/16 Pa fixed point
+        if self._filtered is None:
+            self._filtered = sample
+        else:
+            self._filtered = _ewma(self._filtered, sample, shift)
+        return self._filtered / 1600.0
+
+    def altitude_from(self, pressure: float) -> float:
+        """
+        Altitude in meters for an already measured pressure in hPa, no I2C access
+        """
+        x = pressure * self._inv_slp - 1.0
+        if -0.08 < x < 0.08:
+            # Within ~700 m of sea level pressure altitude use the 5-term binomial series of
+            # 44330.77 * (1 - (1 + x) ** 0.1902632) in Horner form, error < 1 mm, no pow() call
+            return x * (-8434.514158663998 + x * (3414.86825219564 + x * (
+                    -2060.0042477167103 + x * (1447.0174357414892 + x * -1102.5511150371974))))
+        return 44330.77 * (1.0 - ((x + 1.0) ** 0.1902632))
+
+    @staticmethod
+    def slp_from(pressure: float, altitude: float) -> float:
+        """
+        Sea level pressure in hPa for an already measured pressure in hPa at a known altitude in meters
+        """
+        return pressure / (1.0 - altitude / 44330.77) ** 5.255877121797594  # 1 / 0.1902632
 
     @property
     def altitude(self) -> float:
@@ -329,14 +489,11 @@ class BMP581:
         the altitude in meters is calculated with the international barometric formula
         https://ncar.github.io/aircraft_ProcessingAlgorithms/www/PressureAltitude.pdf
         """
-        altitude = 44330.77 * (
-                1.0 - ((self.pressure / self.sea_level_pressure) ** 0.1902632)
-        )
-        return altitude
+        return self.altitude_from(self.pressure)
 
     @altitude.setter
     def altitude(self, value: float) -> None:
-        self.sea_level_pressure = self.pressure / (1.0 - value / 44330.77) ** (1 / 0.1902632)
+        self.sea_level_pressure = self.slp_from(self.pressure, value)
 
     @property
     def sea_level_pressure(self) -> float:
@@ -348,12 +505,7 @@ class BMP581:
     @sea_level_pressure.setter
     def sea_level_pressure(self, value: float) -> None:
         self._sea_level_pressure = value
-
-    @staticmethod
-    def _twos_comp(val: int, bits: int) -> int:
-        if val & (1 << (bits - 1)) != 0:
-            return val - (1 << bits)
-        return val
+        self._inv_slp = 1.0 / value  # altitude multiplies by this instead of dividing on every read
 
     @property
     def iir_coefficient(self) -> str:
@@ -373,24 +525,41 @@ class BMP581:
         +----------------------------+------------------+
         :return: coefficients as string
         """
-        values = ("COEF_0", "COEF_1", "COEF_3", "COEF_7", "COEF_15", "COEF_31", "COEF_63", "COEF_127",)
-        return values[self._iir_coefficient]
+        return self._COEF_NAMES[self._iir_coefficient]
 
     @iir_coefficient.setter
     def iir_coefficient(self, value: int) -> None:
-        if value not in self.iir_coefficient_values:
-            raise ValueError(
-                "Value must be a valid iir_coefficients: COEF_0,COEF_1,COEF_3,COEF_7,COEF_15,COEF_31,COEF_63,COEF_127")
+        self._check_iir(value)
 
         # Ensure the sensor is in STANDBY mode before updating
         original_mode = self._power_mode  # Save the current mode
         if original_mode != STANDBY:
-            self.power_mode = STANDBY  # Set to STANDBY if not already
-        self._iir_coefficient = value
-        self._iir_temp_coefficient = value
+            self._power_mode = STANDBY  # Set to STANDBY if not already
+        self._iir_both = (value << 3) | value
 
-        # Restore the original power mode
-        self.power_mode = original_mode
+        # Restore the original power mode, nothing to restore if it was STANDBY
+        if original_mode != STANDBY:
+            self._power_mode = original_mode
+
+    def sweep_iir(self, values, callback) -> None:
+        """
+        Step through several iir_coefficient settings with only one switch to STANDBY
+        and one restore of the power mode for the whole sweep.
+        callback(value) is called after each setting is written, sensor is in STANDBY then.
+        """
+        for value in values:
+            self._check_iir(value)
+
+        original_mode = self._power_mode  # Save the current mode once
+        if original_mode != STANDBY:
+            self._power_mode = STANDBY
+        for value in values:
+            self._iir_both = (value << 3) | value
+            callback(value)
+
+        # Restore the original power mode once, nothing to restore if it was STANDBY
+        if original_mode != STANDBY:
+            self._power_mode = original_mode
 
     @property
     def output_data_rate(self) -> int:
@@ -401,10 +570,81 @@ class BMP581:
 
     @output_data_rate.setter
     def output_data_rate(self, value: int) -> None:
-        if value not in range(0, 32, 1):
+        if not 0 <= value < 32:
             raise ValueError("Value must be a valid output_data_rate setting: 0 to 32")
         self._output_data_rate = value
 
+    def _check_iir(self, value) -> None:
+        if not 0 <= value <= self._MAX_IIR:
+            raise ValueError(
+                "Value must be a valid iir_coefficients: " + ",".join(self._COEF_NAMES[:self._MAX_IIR + 1]))
+
+    def _check_configure(self, osr_p, osr_t, iir) -> None:
+        if osr_p is not None and not 0 <= osr_p <= self._MAX_OSR:
+            raise ValueError("osr_p must be one of pressure_oversample_rate_values")
+        if osr_t is not None and not 0 <= osr_t <= self._MAX_OSR:
+            raise ValueError("osr_t must be one of temperature_oversample_rate_values")
+        if iir is not None and not 0 <= iir <= self._MAX_IIR:
+            raise ValueError("iir must be one of iir_coefficient_values")
+
+    def _read_settings(self) -> tuple:
+        """
+        Power mode, oversampling & IIR fields from one burst of _DSP_IIR .. _ODR_CONFIG
+        :return: raw (power mode, pressure osr, temperature osr, iir coefficient)
+        """
+        cfg = self._i2c.readfrom_mem(self._address, _DSP_IIR, 7)  # 0x31 .. 0x37
+        osr = cfg[_OSR_CONF - _DSP_IIR]
+        return (cfg[_ODR_CONFIG - _DSP_IIR] & 0x03, (osr >> 3) & 0x07, osr & 0x07,
+                (cfg[0] >> 3) & 0x07)
+
+    def configure(self, *, osr_p: int = None, osr_t: int = None, iir: int = None) -> None:
+        """
+        Set pressure/temperature oversampling and the IIR coefficient together.
+        The configuration registers are read in one burst and each changed register
+        is written once, instead of a read-modify-write per setting.
+        """
+        self._check_configure(osr_p, osr_t, iir)
+        cfg = self._i2c.readfrom_mem(self._address, _DSP_IIR, 7)  # _DSP_IIR 0x31 .. _ODR_CONFIG 0x37
+
+        osr = cfg[_OSR_CONF - _DSP_IIR]
+        new_osr = osr
+        if osr_p is not None:
+            new_osr = (new_osr & 0xC7) | (osr_p << 3)
+        if osr_t is not None:
+            new_osr = (new_osr & 0xF8) | osr_t
+        if new_osr != osr:
+            self._i2c.writeto_mem(self._address, _OSR_CONF, bytes([new_osr]))
+
+        if iir is not None:
+            dsp_iir = cfg[0]
+            new_dsp_iir = (dsp_iir & 0xC0) | (iir << 3) | iir  # same coefficient for pressure & temp
+            if new_dsp_iir != dsp_iir:
+                # Must be in STANDBY to update the IIR coefficients
+                odr = cfg[_ODR_CONFIG - _DSP_IIR]
+                if odr & 0x03 != STANDBY:
+                    self._i2c.writeto_mem(self._address, _ODR_CONFIG, bytes([odr & 0xFC]))
+                self._i2c.writeto_mem(self._address, _DSP_IIR, bytes([new_dsp_iir]))
+                if odr & 0x03 != STANDBY:
+                    self._i2c.writeto_mem(self._address, _ODR_CONFIG, bytes([odr]))
+
+    def _data_ready(self) -> bool:
+        return self._drdy_status
+
+    def wait_drdy(self, timeout_ms: int = 500) -> bool:
+        """
+        Poll the sensor's data-ready status until a new conversion is available,
+        use before reading instead of a fixed sleep. This busy-waits, do not call it from a coroutine.
+        BMP280 has no data-ready flag, it only reports when no conversion is running, so in NORMAL
+        mode it returns True between conversions even if that data was already read.
+        :return: True when new data is ready, False if timeout_ms passed first
+        """
+        deadline = time.ticks_add(time.ticks_ms(), timeout_ms)
+        while not self._data_ready():
+            if time.ticks_diff(deadline, time.ticks_ms()) <= 0:
+                return False
+            time.sleep_us(200)
+        return True
+
 
 class BMP585(BMP581):
     """Driver for the BMP585 Sensor connected over I2C.
@@ -444,49 +684,11 @@ class BMP585(BMP581):
     BMP585_I2C_ADDRESS_DEFAULT = 0x47
     BMP585_I2C_ADDRESS_SECONDARY = 0x46
 
-    _CMD_BMP585 = const(0x7e)
-    _cmd_register_BMP585 = CBits(8, _CMD_BMP585, 0)
-
-    def __init__(self, i2c, address: int = None) -> None:
-        time.sleep_ms(3)  # t_powup done in 2ms
-
-        # If no address is provided, try the default, then secondary
-        if address is None:
-            if self._check_address(i2c, self.BMP585_I2C_ADDRESS_DEFAULT):
-                address = self.BMP585_I2C_ADDRESS_DEFAULT
-            elif self._check_address(i2c, self.BMP585_I2C_ADDRESS_SECONDARY):
-                address = self.BMP585_I2C_ADDRESS_SECONDARY
-            else:
-                raise RuntimeError("BMP585 sensor not found at I2C expected address (0x47,0x46).")
-        else:
-            # Check if the specified address is valid
-            if not self._check_address(i2c, address):
-                raise RuntimeError("BMP585 sensor not found at I2C expected address (0x47,0x46).")
-
-        self._i2c = i2c
-        self._address = address
-        if self._read_device_id() != 0x51:  # check _device_id after i2c established
-            raise RuntimeError("Failed to find the BMP585 sensor")
-
-        self._cmd_register_BMP585 = _SOFTRESET
-        time.sleep_ms(5)  # soft reset finishes in 2ms
-
-        # Must be in STANDBY to initialize _iir_coefficient    
-        self._power_mode = STANDBY
-        time.sleep_ms(5)  # mode change takes 4ms
-        self._pressure_enabled = True
-        self._temperature_oversample_rate = self.OSR1  # Default oversampling
-        self._pressure_oversample_rate = self.OSR1  # Default oversampling
-        self._iir_coefficient = COEF_0
-        self._iir_temp_coefficient = COEF_0
-        self._power_mode = NORMAL
-        time.sleep_ms(5)  # mode change takes 4ms
-        #         self._write_reg(0x18, 0x01)  # Enable data ready interrupts
-        #         val = self._read_reg(0x27, 1)[0]  # Read Interrupt Status Register
-        #         drdy_data_reg = (val & 0x01) != 0  # Check Data Ready bit
-        # 
-        #         print(f"{drdy_data_reg=}")
-        self.sea_level_pressure = WORLD_AVERAGE_SEA_LEVEL_PRESSURE
+    _name = "BMP585"
+    _expected_id = 0x51
+    _primary_addr = BMP585_I2C_ADDRESS_DEFAULT
+    _secondary_addr = BMP585_I2C_ADDRESS_SECONDARY
+    _default_odr = None
 
 
 class BMP390(BMP581):
@@ -530,10 +732,15 @@ class BMP390(BMP581):
     BMP390_FORCED_POWER = const(0x02)
     BMP390_NORMAL_POWER = const(0x03)
     power_mode_values = (BMP390_SLEEP_POWER, BMP390_FORCED_ALT_POWER, BMP390_FORCED_POWER, BMP390_NORMAL_POWER)
+    _MAX_POWER_MODE = len(power_mode_values) - 1
+    # Notice ordering is different only for BMP390 & BMP280
+    _POWER_NAMES = ("STANDBY", "FORCED", "FORCED", "NORMAL")
 
     # oversampling rates
     pressure_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16, OSR32)
     temperature_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16, OSR32)
+    _MAX_OSR = len(pressure_oversample_rate_values) - 1
+    _OSR_NAMES = ("OSR1", "OSR2", "OSR4", "OSR8", "OSR16", "OSR32")
 
     # ODR_SEL page 38 Bosch Data sheet
     BMP390_ODR_25 = const(0x03)  # ODR_25 Hz = 40ms
@@ -541,13 +748,18 @@ class BMP390(BMP581):
     BMP390_I2C_ADDRESS_DEFAULT = 0x7f
     BMP390_I2C_ADDRESS_SECONDARY = 0x7e
 
+    _name = "BMP390"
+    _expected_id = 0x60
+    _primary_addr = BMP390_I2C_ADDRESS_DEFAULT
+    _secondary_addr = BMP390_I2C_ADDRESS_SECONDARY
+
     ###  BMP390 Constants - notice very different than bmp581
     _REG_WHOAMI_BMP390 = const(0x00)
-    _CMD_BMP390 = const(0x7e)
     _CONFIG_BMP390 = const(0x1f)
     _ODR_CONFIG_BMP390 = const(0x1d)
     _OSR_CONF_BMP390 = const(0x1c)
     _PWR_CTRL_BMP390 = const(0x1b)
+    _STATUS_BMP390 = const(0x03)
     _TEMP_DATA_BMP390 = const(0x07)
     _PRESS_DATA_BMP390 = const(0x04)
     _TRIM_COEFF_BMP390 = const(0x31)
@@ -555,46 +767,26 @@ class BMP390(BMP581):
     _device_id = RegisterStruct(_REG_WHOAMI_BMP390, "B")
 
     _mode = CBits(2, _PWR_CTRL_BMP390, 4)
+    _drdy_status = CBits(1, _STATUS_BMP390, 5)  # drdy_press, cleared when pressure data is read
     _temperature_enabled = CBits(1, _PWR_CTRL_BMP390, 1)
     _pressure_enabled = CBits(1, _PWR_CTRL_BMP390, 0)
-    _control_register_BMP390 = CBits(8, _PWR_CTRL_BMP390, 0)
-    _cmd_register_BMP390 = CBits(8, _CMD_BMP390, 0)
 
     _temperature_oversample_rate = CBits(3, _OSR_CONF_BMP390, 3)
     _pressure_oversample_rate = CBits(3, _OSR_CONF_BMP390, 0)
     _iir_coefficient = CBits(3, _CONFIG_BMP390, 1)
     _output_data_rate = CBits(5, _ODR_CONFIG_BMP390, 0)
-    _temperature = CBits(24, _TEMP_DATA_BMP390, 0, 3)
-    _pressure = CBits(24, _PRESS_DATA_BMP390, 0, 3)
 
     def __init__(self, i2c, address: int = None) -> None:
-        time.sleep_ms(3)  # t_powup done in 2ms
-        # If no address is provided, try the default, then secondary
-        if address is None:
-            if self._check_address(i2c, self.BMP390_I2C_ADDRESS_DEFAULT):
-                address = self.BMP390_I2C_ADDRESS_DEFAULT
-            elif self._check_address(i2c, self.BMP390_I2C_ADDRESS_SECONDARY):
-                address = self.BMP390_I2C_ADDRESS_SECONDARY
-            else:
-                raise RuntimeError("BMP390 sensor not found at I2C expected address (0x7f,0x7e).")
-        else:
-            # Check if the specified address is valid
-            if not self._check_address(i2c, address):
-                raise RuntimeError(f"BMP390 sensor not found at specified I2C address (0x{address:02x}).")
+        self._bringup(i2c, address)
 
-        self._i2c = i2c
-        self._address = address
-        if self._read_device_id() != 0x60:  # check _device_id after i2c established
-            raise RuntimeError("Failed to find the BMP390 sensor with id=0x60")
-
-        self._cmd_register_BMP390 = _SOFTRESET
+        self._cmd_register = _SOFTRESET
         time.sleep_ms(5)  # soft reset finishes in ?ms
 
         self._pressure_enabled = True
         self._temperature_enabled = True
         self._output_data_rate = BMP390_ODR_25
         self._mode = BMP390_NORMAL_POWER
-        time.sleep_ms(4)  # mode change takes 3ms
+        self.wait_drdy(10)  # first OSR1 conversion takes ~5ms, bounded instead of a fixed sleep
 
         self.sea_level_pressure = WORLD_AVERAGE_SEA_LEVEL_PRESSURE
         self._read_calibration_bmp390()
@@ -609,6 +801,26 @@ class BMP390(BMP581):
         values = struct.unpack("<HHbhhbbHHbbhbb", coeff)
         self.t1, self.t2, self.t3, self.p1, self.p2, self.p3, self.p4, self.p5, self.p6, self.p7, self.p8, self.p9, self.p10, self.p11 = values
 
+        # Scale the coefficients once (datasheet 8.4), compensation then only multiplies & adds
+        self._k_t1 = self.t1 * 2.0 ** 8
+        self._k_t2 = self.t2 / 2.0 ** 30
+        self._k_t3 = self.t3 / 2.0 ** 48
+        k_p1 = (self.p1 - 2 ** 14) / 2.0 ** 20
+        k_p2 = (self.p2 - 2 ** 14) / 2.0 ** 29
+        k_p3 = self.p3 / 2.0 ** 32
+        k_p4 = self.p4 / 2.0 ** 37
+        k_p5 = self.p5 * 2.0 ** 3
+        k_p6 = self.p6 / 2.0 ** 6
+        k_p7 = self.p7 / 2.0 ** 8
+        k_p8 = self.p8 / 2.0 ** 15
+        k_p9 = self.p9 / 2.0 ** 48
+        k_p10 = self.p10 / 2.0 ** 48
+        k_p11 = self.p11 / 2.0 ** 65
+        # one tuple, compensation unpacks it into locals instead of 11 attribute lookups
+        # the Pa -> hPa conversion is folded in, every term is linear in exactly one coefficient
+        self._k_p = (k_p1 * 0.01, k_p2 * 0.01, k_p3 * 0.01, k_p4 * 0.01, k_p5 * 0.01, k_p6 * 0.01,
+                     k_p7 * 0.01, k_p8 * 0.01, k_p9 * 0.01, k_p10 * 0.01, k_p11 * 0.01)
+
         #         #values for one of sensors in comments, each sensor different
         #         print(f"t1 (16-bit unsigned, H): {self.t1}")    # 27778
         #         print(f"t2 (16-bit unsigned, H): {self.t2}")    # 19674
@@ -641,13 +853,11 @@ class BMP390(BMP581):
         +-----------------------------+------------------+------------------------------+------------------+
         :return: power_mode as string
         """
-        # Notice ordering is different only for BMP390 & BMP280
-        string_name = ("STANDBY", "FORCED", "FORCED", "NORMAL",)
-        return string_name[self._mode]
+        return self._POWER_NAMES[self._mode]
 
     @power_mode.setter
     def power_mode(self, value: int) -> None:
-        if value not in self.power_mode_values:
+        if not 0 <= value <= self._MAX_POWER_MODE:
             raise ValueError("Value must be a valid power_mode setting: STANDBY,FORCED,NORMAL")
         if value == 0x01:  # NORMAL mode requested, change value to 0x03 for bmp390
             value = BMP390_NORMAL_POWER
@@ -673,12 +883,11 @@ class BMP390(BMP581):
         +---------------------------+------------------+
         :return: sampling rate as string
         """
-        string_name = ("OSR1", "OSR2", "OSR4", "OSR8", "OSR16", "OSR32",)
-        return string_name[self._pressure_oversample_rate]
+        return self._OSR_NAMES[self._pressure_oversample_rate]
 
     @pressure_oversample_rate.setter
     def pressure_oversample_rate(self, value: int) -> None:
-        if value not in self.pressure_oversample_rate_values:
+        if not 0 <= value <= self._MAX_OSR:
             raise ValueError("Value must be a valid pressure_oversample_rate: OSR1,OSR2,OSR4,OSR8,OSR16,OSR32")
         self._pressure_oversample_rate = value
 
@@ -700,12 +909,11 @@ class BMP390(BMP581):
         +---------------------------+------------------+
         :return: sampling rate as string
         """
-        string_name = ("OSR1", "OSR2", "OSR4", "OSR8", "OSR16", "OSR32",)
-        return string_name[self._temperature_oversample_rate]
+        return self._OSR_NAMES[self._temperature_oversample_rate]
 
     @temperature_oversample_rate.setter
     def temperature_oversample_rate(self, value: int) -> None:
-        if value not in self.temperature_oversample_rate_values:
+        if not 0 <= value <= self._MAX_OSR:
             raise ValueError(
                 "Value must be a valid temperature_oversample_rate: OSR1,OSR2,OSR4,OSR8,OSR16,OSR32")
         self._temperature_oversample_rate = value
@@ -732,46 +940,87 @@ class BMP390(BMP581):
         +----------------------------+------------------+------------------+
         :return: coefficients as string
         """
-        values = ("COEF_0", "COEF_1", "COEF_3", "COEF_7", "COEF_15", "COEF_31", "COEF_63", "COEF_127",)
-        return values[self._iir_coefficient]
+        return self._COEF_NAMES[self._iir_coefficient]
 
     @iir_coefficient.setter
     def iir_coefficient(self, value: int) -> None:
-        if value not in self.iir_coefficient_values:
-            raise ValueError(
-                "Value must be a valid iir_coefficients: COEF_0,COEF_1,COEF_3,COEF_7,COEF_15,COEF_31,COEF_63,COEF_127")
+        self._check_iir(value)
         self._iir_coefficient = value
 
+    def measurement_time_ms(self) -> int:
+        """
+        Maximum time of one pressure & temperature conversion at the current oversampling,
+        T_conv from datasheet 3.9.2, useful to size waits for FORCED mode
+        :return: conversion time in ms, rounded up
+        """
+        osr = self._i2c.readfrom_mem(self._address, _OSR_CONF_BMP390, 1)[0]
+        conv_us = 234 + (392 + (2020 << (osr & 0x07))) + (163 + (2020 << ((osr >> 3) & 0x07)))
+        return (conv_us + 999) // 1000
+
+    def sweep_iir(self, values, callback) -> None:
+        """
+        Step through several iir_coefficient settings, callback(value) is called after each write.
+        The BMP390 filter can be changed in any power mode, so no mode switching is needed.
+        """
+        for value in values:
+            self._check_iir(value)
+        for value in values:
+            self._iir_coefficient = value
+            callback(value)
+
+    def _read_settings(self) -> tuple:
+        """
+        Power mode, oversampling & IIR fields from one burst of _PWR_CTRL_BMP390 .. _CONFIG_BMP390
+        :return: raw (power mode, pressure osr, temperature osr, iir coefficient)
+        """
+        cfg = self._i2c.readfrom_mem(self._address, _PWR_CTRL_BMP390, 5)  # 0x1b .. 0x1f
+        osr = cfg[_OSR_CONF_BMP390 - _PWR_CTRL_BMP390]
+        return ((cfg[0] >> 4) & 0x03, osr & 0x07, (osr >> 3) & 0x07,
+                (cfg[_CONFIG_BMP390 - _PWR_CTRL_BMP390] >> 1) & 0x07)
+
+    def configure(self, *, osr_p: int = None, osr_t: int = None, iir: int = None) -> None:
+        """
+        Set pressure/temperature oversampling and the IIR coefficient together.
+        The configuration registers are read in one burst and each changed register
+        is written once, instead of a read-modify-write per setting.
+        """
+        self._check_configure(osr_p, osr_t, iir)
+        cfg = self._i2c.readfrom_mem(self._address, _OSR_CONF_BMP390, 4)  # OSR 0x1c .. CONFIG 0x1f
+
+        osr = cfg[0]
+        new_osr = osr
+        if osr_p is not None:
+            new_osr = (new_osr & 0xF8) | osr_p
+        if osr_t is not None:
+            new_osr = (new_osr & 0xC7) | (osr_t << 3)
+        if new_osr != osr:
+            self._i2c.writeto_mem(self._address, _OSR_CONF_BMP390, bytes([new_osr]))
+
+        if iir is not None:
+            config = cfg[_CONFIG_BMP390 - _OSR_CONF_BMP390]
+            new_config = (config & 0xF1) | (iir << 1)
+            if new_config != config:
+                self._i2c.writeto_mem(self._address, _CONFIG_BMP390, bytes([new_config]))
+
     # Helper method for temperature compensation
+    @micropython.native
     def _calculate_temperature_compensation(self, raw_temp: float) -> float:
-        partial_data1 = float(raw_temp - (self.t1 * 2 ** 8))
-        partial_data2 = partial_data1 * (self.t2 / 2 ** 30)
-        tempc = partial_data2 + (partial_data1 * partial_data1) * (self.t3 / 2 ** 48)
-        return tempc
+        partial_data1 = raw_temp - self._k_t1
+        return partial_data1 * (self._k_t2 + partial_data1 * self._k_t3)
 
     # Helper method for pressure compensation
+    @micropython.native
     def _calculate_pressure_compensation(self, raw_pressure: float, tempc: float) -> float:
-        # First part
-        partial_data1 = (self.p6 / 2 ** 6) * tempc
-        partial_data2 = (self.p7 / 2 ** 8) * (tempc * tempc)
-        partial_data3 = (self.p8 / 2 ** 15) * (tempc * tempc * tempc)
-        partial_out1 = (self.p5 * 2 ** 3) + partial_data1 + partial_data2 + partial_data3
-
-        # Second part
-        partial_data1 = ((self.p2 - 2 ** 14) / 2 ** 29) * tempc
-        partial_data2 = (self.p3 / 2 ** 32) * (tempc * tempc)
-        partial_data3 = (self.p4 / 2 ** 37) * (tempc * tempc * tempc)
-        partial_out2 = raw_pressure * (
-                ((self.p1 - 2 ** 14) / 2 ** 20) + partial_data1 + partial_data2 + partial_data3)
-
-        # Third part
-        partial_data1 = raw_pressure * raw_pressure
-        partial_data2 = (self.p9 / 2 ** 48) + (self.p10 / 2 ** 48) * tempc
-        partial_data3 = partial_data1 * partial_data2
-        partial_data4 = partial_data3 + (raw_pressure * raw_pressure * raw_pressure) * (self.p11 / 2 ** 65)
-
-        # Final compensated pressure
-        return partial_out1 + partial_out2 + partial_data4
+        # Datasheet 8.6 polynomials in Horner form: p5 + p6*t + p7*t^2 + p8*t^3 and
+        # p1 + p2*t + p3*t^2 + p4*t^3, the raw pressure terms share p^2
+        k_p1, k_p2, k_p3, k_p4, k_p5, k_p6, k_p7, k_p8, k_p9, k_p10, k_p11 = self._k_p
+        partial_out1 = k_p5 + tempc * (k_p6 + tempc * (k_p7 + tempc * k_p8))
+        partial_out2 = raw_pressure * (k_p1 + tempc * (k_p2 + tempc * (k_p3 + tempc * k_p4)))
+        raw_pressure2 = raw_pressure * raw_pressure
+        partial_out3 = raw_pressure2 * (k_p9 + k_p10 * tempc + raw_pressure * k_p11)
+
+        # Final compensated pressure in hPa, _k_p includes the Pa -> hPa scaling
+        return partial_out1 + partial_out2 + partial_out3
 
     @property
     def temperature(self) -> float:
@@ -779,21 +1028,42 @@ class BMP390(BMP581):
         The temperature sensor in Celsius
         :return: Temperature in Celsius
         """
-        raw_temp = self._temperature
+        if self.cache_ttl_ms:
+            return self.read_pt()[1]
+        raw_temp = self._read_u24(_TEMP_DATA_BMP390)
         return self._calculate_temperature_compensation(raw_temp)
 
     @property
     def pressure(self) -> float:
         """
         The sensor pressure in hPa
+        Pressure compensation needs the temperature too, both come from one I2C burst
         :return: Pressure in hPa
         """
-        raw_pressure = float(self._pressure)
-        raw_temp = float(self._temperature)
+        return self.read_pt()[0]
+
+    def read_raw_pt(self) -> tuple:
+        """
+        Read the raw pressure and temperature from a single I2C burst of the data registers
+        :return: (raw pressure, raw temperature)
+        """
+        data = self._rx
+        self._readmem(self._address, _PRESS_DATA_BMP390, data)
+        raw_pressure = _u24(data, 0)
+        raw_temp = _u24(data, 3)
+        return raw_pressure, raw_temp
 
-        tempc = self._calculate_temperature_compensation(raw_temp)
-        comp_press = self._calculate_pressure_compensation(raw_pressure, tempc)
-        return comp_press / 100.0  # Convert to hPa
+    def compensate_t(self, raw_temp: int) -> float:
+        """
+        :return: Temperature in Celsius from a raw temperature reading
+        """
+        return self._calculate_temperature_compensation(float(raw_temp))
+
+    def compensate_p(self, raw_pressure: int, tempc: float) -> float:
+        """
+        :return: Pressure in hPa from a raw pressure reading and the compensated temperature
+        """
+        return self._calculate_pressure_compensation(float(raw_pressure), tempc)
 
 
 class BMP280(BMP581):
@@ -832,6 +1102,9 @@ class BMP280(BMP581):
     """
     # Power Modes for BMP280
     power_mode_values = (STANDBY, FORCED, NORMAL)
+    _MAX_POWER_MODE = len(power_mode_values) - 1
+    # Notice ordering is different only for BMP390 & BMP280
+    _POWER_NAMES = ("STANDBY", "FORCED", "FORCED", "NORMAL")
     BMP280_NORMAL_POWER = const(0x03)
     BMP280_FORCED_POWER = const(0x01)
 
@@ -845,16 +1118,30 @@ class BMP280(BMP581):
     # OSR_SKIP turns off sampling and we do not present it as setable from outside the driver
     pressure_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16)
     temperature_oversample_rate_values = (OSR1, OSR2, OSR4, OSR8, OSR16)
+    # BMP280 filter field only goes up to COEF_15
+    iir_coefficient_values = (COEF_0, COEF_1, COEF_3, COEF_7, COEF_15)
+    _MAX_OSR = len(pressure_oversample_rate_values) - 1
+    _MAX_IIR = len(iir_coefficient_values) - 1
+    # Notice these are in the order and numbering that is appropriate for bmp280, which is different
+    # than the other sensors
+    _OSR_NAMES = ("OSR_SKIP", "OSR1", "OSR2", "OSR4", "OSR8", "OSR16")
 
     BMP280_I2C_ADDRESS_DEFAULT = 0x77
     BMP280_I2C_ADDRESS_SECONDARY = 0x76
 
+    _name = "BMP280"
+    _expected_id = 0x58
+    _primary_addr = BMP280_I2C_ADDRESS_DEFAULT
+    _secondary_addr = BMP280_I2C_ADDRESS_SECONDARY
+
     ###  BMP390 Constants - notice very different than bmp581
     _REG_WHOAMI_BMP280 = const(0xd0)
     _PWR_CTRL_BMP280 = const(0x1b)
     _CONTROL_REGISTER_BMP280 = const(0xF4)
     _CONFIG_BMP280 = const(0xf5)
     _RESET_BMP280 = const(0xe0)
+    _STATUS_BMP280 = const(0xf3)
+    _DATA_BMP280 = const(0xf7)
     _TRIM_COEFF_BMP280 = const(0x88)
 
     _device_id = RegisterStruct(_REG_WHOAMI_BMP280, "B")
@@ -864,33 +1151,14 @@ class BMP280(BMP581):
     _temperature_oversample_rate = CBits(3, _CONTROL_REGISTER_BMP280, 5)
     _control_register = CBits(8, _CONTROL_REGISTER_BMP280, 0)
     _config_register = CBits(8, _CONFIG_BMP280, 0)
-    _reset_register = CBits(8, _RESET_BMP280, 0)
+    _cmd_register = CBits(8, _RESET_BMP280, 0)
+    _measuring = CBits(1, _STATUS_BMP280, 3)
     _iir_coefficient = CBits(3, _CONFIG_BMP280, 2)
 
-    # read pressure 0xf7 and temp 0xfa
-    _d = CBits(48, 0xf7, 0, 6)
-
     def __init__(self, i2c, address: int = None) -> None:
-        time.sleep_ms(3)  # t_powup done in 2ms
+        self._bringup(i2c, address)
 
-        # If no address is provided, try the default, then secondary
-        if address is None:
-            if self._check_address(i2c, self.BMP280_I2C_ADDRESS_DEFAULT):
-                address = self.BMP280_I2C_ADDRESS_DEFAULT
-            elif self._check_address(i2c, self.BMP280_I2C_ADDRESS_SECONDARY):
-                address = self.BMP280_I2C_ADDRESS_SECONDARY
-            else:
-                raise RuntimeError("BMP280 sensor not found at I2C expected address (0x77,0x76).")
-        else:
-            # Check if the specified address is valid
-            if not self._check_address(i2c, address):
-                raise RuntimeError("BMP280 sensor not found at I2C expected address (0x77,0x76).")
-        self._i2c = i2c
-        self._address = address
-        if self._read_device_id() != 0x58:  # check _device_id after i2c established
-            raise RuntimeError("Failed to find the BMP280 sensor with id 0x58")
-
-        self._reset_register_BMP280 = _SOFTRESET
+        self._cmd_register = _SOFTRESET
         time.sleep_ms(5)  # soft reset finishes in ?ms
 
         self._read_calibration_bmp280()
@@ -902,8 +1170,7 @@ class BMP280(BMP581):
                 self._translate_osr_bmp280(OSR1) << 2) + BMP280_NORMAL_POWER
         _ = self.pressure
 
-        time.sleep_ms(4)  # mode change takes 3ms
-        time.sleep_ms(63)  # OSR can be take up to 62.5ms standby
+        time.sleep_ms(self.measurement_time_ms())  # first conversion at the OSR just set
 
         self.t_fine = 0
         self.sea_level_pressure = WORLD_AVERAGE_SEA_LEVEL_PRESSURE
@@ -918,6 +1185,27 @@ class BMP280(BMP581):
         values = struct.unpack("<HhhHhhhhhhhh", coeff)
         self.t1, self.t2, self.t3, self.p1, self.p2, self.p3, self.p4, self.p5, self.p6, self.p7, self.p8, self.p9 = values
 
+        # Scale the coefficients once (datasheet 8.1), compensation then only multiplies & adds
+        self._k_t1a = self.t1 / 2.0 ** 10
+        self._k_t1b = self.t1 / 2.0 ** 13
+        self._k_t2 = float(self.t2)
+        self._k_t3 = float(self.t3)
+        k_p1 = float(self.p1)
+        k_p1s = self.p1 / 2.0 ** 15
+        k_p2 = self.p2 / 2.0 ** 19
+        k_p3 = self.p3 / 2.0 ** 38
+        k_p4 = self.p4 * 2.0 ** 4  # var2 is kept pre-divided by 4096
+        k_p5 = self.p5 / 2.0 ** 13
+        k_p6 = self.p6 / 2.0 ** 29
+        k_p7 = self.p7 / 2.0 ** 4
+        k_p8 = self.p8 / 2.0 ** 19
+        k_p9 = self.p9 / 2.0 ** 35
+        # one tuple, compensation unpacks it into locals instead of 10 attribute lookups
+        # the last step p + p * (p * k_p9 + k_p8) + k_p7 in Pa is folded into hPa coefficients:
+        # p * (p * k_p9 * 0.01 + (1 + k_p8) * 0.01) + k_p7 * 0.01
+        self._k_p = (k_p1, k_p1s, k_p2, k_p3, k_p4, k_p5, k_p6,
+                     k_p7 * 0.01, (1.0 + k_p8) * 0.01, k_p9 * 0.01)
+
         # values for one of sensors in comments, each sensor different
         #         print(f"t1 (16-bit unsigned, H): {self.t1}")    # 27753
         #         print(f"t2 (16-bit signed, h): {self.t2}")      # 26492
@@ -934,16 +1222,32 @@ class BMP280(BMP581):
         return
 
     def _translate_osr_bmp280(self, osr_value):
-        """ Map the constants to their corresponding values """
-        osr_map = {
-            OSR1: 1,    # OSR1=0 for other sensors, but 1 for bmp280
-            OSR2: 2,     # OSR2=1 for other sensors, but 2 for bmp280
-            OSR4: 3,     # OSR4=2 for other sensors, but 3 for bmp280
-            OSR8: 4,     # OSR8=3 for other sensors, but 4 for bmp280
-            OSR16: 5,    # OSR16=4 for other sensors, but 5 for bmp280
-            OSR_SKIP: 0  # OSR_SKIP=0 for bmp280, no other sensor has OSR_SKIP, we assigned it to 0x05
-        }
-        return osr_map.get(osr_value, 0)
+        """
+        Map the constants to their corresponding values, OSR1=0 for other sensors but 1 for bmp280, etc.
+        OSR_SKIP=0 for bmp280, no other sensor has OSR_SKIP, we assigned it to 0x05
+        """
+        return _BMP280_OSR[osr_value] if 0 <= osr_value <= 5 else 0
+
+    def _data_ready(self) -> bool:
+        # BMP280 has no data-ready flag, a conversion is done when it is no longer measuring,
+        # in NORMAL mode this is also True between conversions, so only FORCED mode waits for new data
+        return not self._measuring
+
+    def measurement_time_ms(self) -> int:
+        """
+        Maximum time of one pressure & temperature measurement at the current oversampling,
+        t_measure,max from datasheet 3.8.1, useful to size waits for FORCED mode
+        :return: measurement time in ms, rounded up
+        """
+        ctrl = self._i2c.readfrom_mem(self._address, _CONTROL_REGISTER_BMP280, 1)[0]
+        osrs_t = ctrl >> 5
+        osrs_p = (ctrl >> 2) & 0x07
+        meas_us = 1250
+        if osrs_t:  # 0 is skipped, 1..5 are 1x..16x
+            meas_us += 2300 << (osrs_t - 1)
+        if osrs_p:
+            meas_us += (2300 << (osrs_p - 1)) + 575
+        return (meas_us + 999) // 1000
 
     @property
     def power_mode(self) -> str:
@@ -960,13 +1264,11 @@ class BMP280(BMP581):
         +-----------------------------+------------------+------------------------------+------------------+
         :return: power_mode as string
         """
-        # Notice ordering is different only for BMP390 & BMP280
-        string_name = ("STANDBY", "FORCED", "FORCED", "NORMAL",)
-        return string_name[self._mode]
+        return self._POWER_NAMES[self._mode]
 
     @power_mode.setter
     def power_mode(self, value: int) -> None:
-        if value not in self.power_mode_values:
+        if not 0 <= value <= self._MAX_POWER_MODE:
             raise ValueError("Value must be a valid power_mode setting: STANDBY,FORCED,NORMAL")
         if value == 0x01:  # NORMAL mode requested, change value to 0x03 for bmp390
             value = BMP390_NORMAL_POWER
@@ -992,22 +1294,14 @@ class BMP280(BMP581):
         +---------------------------+------------------+---------------------------+------------------+
         :return: sampling rate as string
         """
-        # Notice these are in the order and numbering that is appropriate for bmp280, which is different
-        # than the other sensors
-        string_name = ("OSR_SKIP", "OSR1", "OSR2", "OSR4", "OSR8", "OSR16",)
-        return string_name[self._pressure_oversample_rate]
+        return self._OSR_NAMES[self._pressure_oversample_rate]
 
     @pressure_oversample_rate.setter
     def pressure_oversample_rate(self, value: int) -> None:
-        if value not in self.pressure_oversample_rate_values:
+        if not 0 <= value <= self._MAX_OSR:
             raise ValueError("Value must be a valid pressure_oversample_rate: OSR_SKIP,OSR1,OSR2,OSR4,OSR8,OSR16")
-        # Get whole control register for temp Oversample (3-bit), pressure Oversample (3-bit), & powermode (2-bit)
-        current_control_register = self._control_register
         # only update pressure oversample
-        current_control_register = (current_control_register & 0xe3) + (self._translate_osr_bmp280(value) << 2)
-        # Write whole control register at once
-        self._config_register = 0x00
-        self._control_register = current_control_register
+        self._update_control_register(0xe3, self._translate_osr_bmp280(value) << 2)
 
     @property
     def temperature_oversample_rate(self) -> str:
@@ -1025,58 +1319,130 @@ class BMP280(BMP581):
         +---------------------------+------------------+---------------------------+------------------+
         :return: sampling rate as string
         """
-        string_name = ("OSR_SKIP", "OSR1", "OSR2", "OSR4", "OSR8", "OSR16",)
-        return string_name[self._temperature_oversample_rate]
+        return self._OSR_NAMES[self._temperature_oversample_rate]
 
     @temperature_oversample_rate.setter
     def temperature_oversample_rate(self, value: int) -> None:
-        if value not in self.temperature_oversample_rate_values:
+        if not 0 <= value <= self._MAX_OSR:
             raise ValueError("Value must be a valid pressure_oversample_rate: OSR_SKIP,OSR1,OSR2,OSR4,OSR8,OSR16")
-        # Get current control register for temp Oversample (3-bit), pressure Oversample (3-bit), powermode (8-bit)
-        current_control_register = self._control_register
         # only update temperature oversample
-        current_control_register = (current_control_register & 0x1f) + (self._translate_osr_bmp280(value) << 5)
-        # Write whole control register at once
-        self._config_register = 0x00
-        self._control_register = current_control_register
+        self._update_control_register(0x1f, self._translate_osr_bmp280(value) << 5)
 
-    def _get_raw_temp_pressure(self):
-        raw_data = self._d
-        t_xlsb = (raw_data >> 40) & 0xFF
-        t_lsb = (raw_data >> 32) & 0xFF
-        t_msb = (raw_data >> 24) & 0xFF
-        p_xlsb = (raw_data >> 16) & 0xFF
-        p_lsb = (raw_data >> 8) & 0xFF
-        p_msb = raw_data & 0xFF
-        self._p_raw = (p_msb << 12) | (p_lsb << 4) | (p_xlsb >> 4)
-        self._t_raw = (t_msb << 12) | (t_lsb << 4) | (t_xlsb >> 4)
-        return self._t_raw, self._p_raw
+    def _update_control_register(self, keep_mask: int, bits: int) -> None:
+        """
+        Read-modify-write of the control register, temp Oversample (3-bit), pressure Oversample (3-bit)
+        & powermode (2-bit), in one read and one write. It is not shadowed: FORCED mode returns the
+        mode bits to sleep by itself, so writing back a cached copy would start another conversion
+        """
+        ctrl = self._i2c.readfrom_mem(self._address, _CONTROL_REGISTER_BMP280, 1)[0]
+        self._i2c.writeto_mem(self._address, _CONTROL_REGISTER_BMP280, bytes([(ctrl & keep_mask) | bits]))
+
+    @property
+    def iir_coefficient(self) -> str:
+        """
+        Sensor iir_coefficient, BMP280 supports COEF_0 to COEF_15
+        :return: coefficients as string
+        """
+        return self._COEF_NAMES[self._iir_coefficient]
+
+    @iir_coefficient.setter
+    def iir_coefficient(self, value: int) -> None:
+        self._check_iir(value)
+
+        # config register writes may be ignored in normal mode, write it in sleep (STANDBY)
+        original_mode = self._mode
+        if original_mode != STANDBY:
+            self._mode = STANDBY
+        self._iir_coefficient = value
+        if original_mode != STANDBY:
+            self._mode = original_mode
+
+    def sweep_iir(self, values, callback) -> None:
+        """
+        Step through several iir_coefficient settings with only one switch to sleep (STANDBY)
+        and one restore of the power mode for the whole sweep.
+        callback(value) is called after each setting is written, sensor is in STANDBY then.
+        """
+        for value in values:
+            self._check_iir(value)
+
+        original_mode = self._mode
+        if original_mode != STANDBY:
+            self._mode = STANDBY
+        for value in values:
+            self._iir_coefficient = value
+            callback(value)
+        if original_mode != STANDBY:
+            self._mode = original_mode
+
+    def _read_settings(self) -> tuple:
+        """
+        Power mode, oversampling & IIR fields from one burst of _CONTROL_REGISTER_BMP280 & _CONFIG_BMP280
+        :return: raw (power mode, pressure osr, temperature osr, iir coefficient)
+        """
+        ctrl, config = self._i2c.readfrom_mem(self._address, _CONTROL_REGISTER_BMP280, 2)
+        return ctrl & 0x03, (ctrl >> 2) & 0x07, ctrl >> 5, (config >> 2) & 0x07
+
+    def configure(self, *, osr_p: int = None, osr_t: int = None, iir: int = None) -> None:
+        """
+        Set pressure/temperature oversampling and the IIR coefficient together.
+        The control & config registers are read in one burst and each changed register
+        is written once, instead of a read-modify-write per setting.
+        """
+        self._check_configure(osr_p, osr_t, iir)
+        cfg = self._i2c.readfrom_mem(self._address, _CONTROL_REGISTER_BMP280, 2)  # ctrl_meas 0xf4, config 0xf5
+
+        control = cfg[0]
+        new_control = control
+        if osr_p is not None:
+            new_control = (new_control & 0xE3) | (self._translate_osr_bmp280(osr_p) << 2)
+        if osr_t is not None:
+            new_control = (new_control & 0x1F) | (self._translate_osr_bmp280(osr_t) << 5)
+        if new_control != control:
+            self._i2c.writeto_mem(self._address, _CONTROL_REGISTER_BMP280, bytes([new_control]))
+
+        if iir is not None:
+            config = cfg[1]
+            new_config = (config & 0xE3) | (iir << 2)
+            if new_config != config:
+                # config writes may be ignored in normal mode, write it in sleep (STANDBY)
+                if new_control & 0x03 != STANDBY:
+                    self._i2c.writeto_mem(self._address, _CONTROL_REGISTER_BMP280, bytes([new_control & 0xFC]))
+                self._i2c.writeto_mem(self._address, _CONFIG_BMP280, bytes([new_config]))
+                if new_control & 0x03 != STANDBY:
+                    self._i2c.writeto_mem(self._address, _CONTROL_REGISTER_BMP280, bytes([new_control]))
 
+    def _get_raw_temp_pressure(self):
+        # pressure 0xf7..0xf9 then temp 0xfa..0xfc, big-endian 20-bit values, read into
+        # the preallocated buffer instead of building a 48-bit int from a descriptor
+        data = self._rx
+        self._readmem(self._address, _DATA_BMP280, data)
+        p_raw = (data[0] << 12) | (data[1] << 4) | (data[2] >> 4)
+        t_raw = (data[3] << 12) | (data[4] << 4) | (data[5] >> 4)
+        return t_raw, p_raw
+
+    @micropython.native
     def _calculate_temperature_compensation_bmp280(self, raw_temp: float) -> float:
-        var1 = (((raw_temp / 16384) - (self.t1 / 1024)) * self.t2)
-        var2 = ((((raw_temp / 131072) - (self.t1 / 8192)) *
-                 ((raw_temp / 131072) - (self.t1 / 8192))) * self.t3)
-        self.t_fine = int(var1 + var2)  # Store t_fine as an instance variable
-        tempc = (var1 + var2) / 5120.0
-        return tempc
-
-    def _calculate_pressure_compensation_bmp280(self, raw_pressure: float, tempc: float) -> float:
-        var1 = (self.t_fine / 2.0) - 64000
-        var2 = var1 * var1 * self.p6 / 32768
-        var2 += var1 * self.p5 * 2.0
-        var2 = (var2 / 4.0) + (self.p4 * 65536)
-        var1 = ((self.p3 * var1 * var1 / 524288) + (self.p2 * var1)) / 524288
-        var1 = (1.0 + var1 / 32768) * self.p1
+        var1 = (raw_temp * 6.103515625e-05 - self._k_t1a) * self._k_t2  # raw_temp / 2**14
+        var2 = raw_temp * 7.62939453125e-06 - self._k_t1b  # raw_temp / 2**17
+        t_fine = var1 + var2 * var2 * self._k_t3
+        self.t_fine = int(t_fine)  # Store t_fine as an instance variable, pressure compensation uses it
+        return t_fine / 5120.0
+
+    @micropython.native
+    def _calculate_pressure_compensation_bmp280(self, raw_pressure: float) -> float:
+        # Datasheet 8.1 in Horner form, the power of two scaling is folded into the _k_p coefficients
+        k_p1, k_p1s, k_p2, k_p3, k_p4, k_p5, k_p6, k_p7, k_p8, k_p9 = self._k_p
+        var1 = self.t_fine * 0.5 - 64000.0
+        var2 = var1 * (var1 * k_p6 + k_p5) + k_p4
+        var1 = var1 * (var1 * k_p3 + k_p2)
+        var1 = k_p1 + var1 * k_p1s
 
         if var1 == 0.0:
             return 0  # Avoid division by zero
 
-        p = 1048576.0 - raw_pressure
-        p = (p - (var2 / 4096)) * 6250 / var1
-        var1 = self.p9 * p * p / 2147483648
-        var2 = p * self.p8 / 32768
-
-        return p + (var1 + var2 + self.p7) / 16.0
+        p = (1048576.0 - raw_pressure - var2) * 6250.0 / var1
+        return p * (p * k_p9 + k_p8) + k_p7  # hPa
 
     @property
     def temperature(self) -> float:
@@ -1084,6 +1450,8 @@ class BMP280(BMP581):
         The temperature sensor in Celsius
         :return: Temperature in Celsius
         """
+        if self.cache_ttl_ms:
+            return self.read_pt()[1]
         raw_temp, raw_pressure = self._get_raw_temp_pressure()
         return self._calculate_temperature_compensation_bmp280(raw_temp)
 
@@ -1091,10 +1459,29 @@ class BMP280(BMP581):
     def pressure(self) -> float:
         """
         The sensor pressure in hPa
+        Pressure compensation needs the temperature too, both come from one I2C burst
         :return: Pressure in hPa
         """
+        return self.read_pt()[0]
+
+    def read_raw_pt(self) -> tuple:
+        """
+        Read the raw pressure and temperature from a single I2C burst of the data registers
+        :return: (raw pressure, raw temperature)
+        """
         raw_temp, raw_pressure = self._get_raw_temp_pressure()
+        return raw_pressure, raw_temp
 
-        tempc = self._calculate_temperature_compensation_bmp280(raw_temp)
-        comp_press = self._calculate_pressure_compensation_bmp280(raw_pressure, tempc)
-        return comp_press / 100.0  # Convert to hPa
+    def compensate_t(self, raw_temp: int) -> float:
+        """
+        Also updates t_fine, which compensate_p() uses
+        :return: Temperature in Celsius from a raw temperature reading
+        """
+        return self._calculate_temperature_compensation_bmp280(raw_temp)
+
+    def compensate_p(self, raw_pressure: int, tempc: float) -> float:
+        """
+        Must be called after compensate_t() for the same sample, it uses t_fine instead of tempc
+        :return: Pressure in hPa from a raw pressure reading
+        """
+        return self._calculate_pressure_compensation_bmp280(raw_pressure)